@@ -1,5 +1,6 @@
 # File: trendsagi/__init__.py
 
 from .client import TrendsAGIClient # Assuming TrendsAGIClient is in trendsagi/client.py
+from .async_client import AsyncTrendsAGIClient
 from . import exceptions            # Assuming exceptions are defined in trendsagi/exceptions.py
                                     # Or: from .errors import exceptions if it's in trendsagi/errors.py
\ No newline at end of file
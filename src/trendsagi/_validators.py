@@ -0,0 +1,48 @@
+# File: trendsagi/_validators.py
+"""
+Prebuilt pydantic validators shared by the sync and async clients.
+
+Each ``TypeAdapter`` is constructed once, on first use, and then cached as a module
+global so later lookups are a plain attribute access. Building them lazily means a
+program only imports the model submodules it actually calls. Endpoints that go
+from raw bytes use ``validate_json``; paths that already hold decoded Python data
+(streamed items, bodies that need inspecting first) use ``validate_python``.
+"""
+
+from typing import Any, Callable, Dict, List
+
+from pydantic import TypeAdapter
+
+from . import models
+
+_FACTORIES: Dict[str, Callable[[], TypeAdapter]] = {
+    # --- List endpoints (validated from raw bytes) ---
+    "TOPIC_INTEREST_LIST": lambda: TypeAdapter(List[models.TopicInterest]),
+    "EXPORT_CONFIG_LIST": lambda: TypeAdapter(List[models.ExportConfiguration]),
+    "PLAN_LIST": lambda: TypeAdapter(List[models.SubscriptionPlan]),
+
+    # --- Polling endpoints (validated from raw bytes) ---
+    # Dashboards poll these constantly; calling the core validator through a prebuilt
+    # adapter skips the per-call classmethod dispatch of ``model_validate_json``.
+    "DASHBOARD_STATS": lambda: TypeAdapter(models.DashboardStats),
+    "NOTIFICATION_LIST": lambda: TypeAdapter(models.NotificationListResponse),
+
+    # --- Dict-path validators ---
+    "TREND_ITEM": lambda: TypeAdapter(models.TrendItem),
+    "TREND_SEARCH_RESULT_ITEM": lambda: TypeAdapter(models.TrendSearchResultItem),
+    "AI_INSIGHT": lambda: TypeAdapter(models.AIInsight),
+
+    # --- Request bodies (validated locally, then dumped straight to JSON bytes) ---
+    "CUSTOM_REPORT_REQUEST": lambda: TypeAdapter(models.CustomReportRequest),
+    "RECOMMENDATION_ACTION_REQUEST": lambda: TypeAdapter(models.RecommendationActionRequest),
+    "EXPORT_CONFIG_REQUEST": lambda: TypeAdapter(models.ExportConfigurationRequest),
+}
+
+
+def __getattr__(name: str) -> Any:
+    factory = _FACTORIES.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    adapter = factory()
+    globals()[name] = adapter
+    return adapter
@@ -0,0 +1,586 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Optional, List, Dict, Any, AsyncIterator, Awaitable, Callable, Iterable, Type, Union
+
+import httpx
+from pydantic import TypeAdapter
+
+from . import models
+from . import exceptions
+from . import _validators
+from .client import (
+    ModelT,
+    T,
+    _ItemStream,
+    _SSEParser,
+    _SSE_HEADERS,
+    _TTLCache,
+    _backoff,
+    _build_event,
+    _build_item,
+    _build_model,
+    _complete_analysis_chunk,
+    _drop_none,
+    _encode_body,
+    _encode_request,
+    _fast_build,
+    _handle_response,
+    _is_event_stream,
+    _json_loads,
+    _retry_delay,
+    _should_retry,
+    _ttl_cached,
+    _session_options,
+)
+
+class AsyncTrendsAGIClient:
+    """
+    An asyncio client for the TrendsAGI API, mirroring :class:`~trendsagi.TrendsAGIClient`.
+
+    Every API method is a coroutine, so independent calls can be overlapped, e.g.
+    ``await asyncio.gather(*(client.get_trend_details(i) for i in ids))``.
+
+    :param api_key: Your TrendsAGI API key, generated from your profile page.
+    :param base_url: The base URL of the TrendsAGI API. Defaults to the production URL.
+    :param trust_server: If True, skip response validation. See :class:`~trendsagi.TrendsAGIClient`
+                         for the caveats; only enable this against the official TrendsAGI API.
+    :param max_retries: How many times to retry failed connections and transient 429/5xx responses.
+    :param cache_ttl: Seconds to cache results of slow-changing GET endpoints. None uses the
+                      per-endpoint default; 0 disables caching.
+    :param max_pool: How many connections to keep alive for reuse. Defaults to 32.
+    :param timeout: Seconds to wait on connect/read/write before giving up, or None (the default)
+                    to wait indefinitely.
+    """
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.trendsagi.com",
+        trust_server: bool = False,
+        max_retries: int = 3,
+        cache_ttl: Optional[float] = None,
+        max_pool: int = 32,
+        timeout: Optional[float] = None,
+    ):
+        if not api_key:
+            raise exceptions.AuthenticationError(error_detail="API key is required.")
+        
+        self.base_url = base_url.rstrip('/')
+        self.trust_server = trust_server
+        self.max_retries = max_retries
+        self.cache_ttl = cache_ttl
+        self._cache = _TTLCache()
+        self._session = httpx.AsyncClient(
+            **_session_options(api_key, self.base_url, max_pool, timeout)
+        )
+
+    async def close(self) -> None:
+        """Close the underlying connection pool."""
+        await self._session.aclose()
+
+    def clear_cache(self) -> None:
+        """Drop every cached response."""
+        self._cache.clear()
+
+    async def __aenter__(self) -> "AsyncTrendsAGIClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def _request(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        """Internal helper for making API requests. See ``TrendsAGIClient._request``."""
+        kwargs = _encode_body(kwargs)
+        attempt = 0
+        while True:
+            try:
+                response = await self._session.request(method, endpoint, **kwargs)
+            except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+                # Nothing reached the server, so this is safe to retry for any method.
+                if attempt < self.max_retries:
+                    await asyncio.sleep(_backoff(attempt))
+                    attempt += 1
+                    continue
+                raise exceptions.TrendsAGIError(f"Network error communicating with API: {e}")
+            except httpx.HTTPError as e:
+                raise exceptions.TrendsAGIError(f"Network error communicating with API: {e}")
+            if attempt < self.max_retries and _should_retry(method, response):
+                delay = _retry_delay(response, attempt)
+                if delay is not None:
+                    await asyncio.sleep(delay)
+                    attempt += 1
+                    continue
+            return _handle_response(response)
+
+    async def _request_json(self, method: str, endpoint: str, **kwargs) -> Any:
+        """Make a request and return the decoded JSON body, or None for 204 responses."""
+        response = await self._request(method, endpoint, **kwargs)
+        if response.status_code == 204:
+            return None
+        return _json_loads(response.content)
+
+    async def _request_status(self, method: str, endpoint: str, **kwargs) -> int:
+        """Make a request whose body is not needed and return only the status code."""
+        response = await self._request(method, endpoint, **kwargs)
+        return response.status_code
+
+    async def _request_model(
+        self,
+        method: str,
+        endpoint: str,
+        model_cls: Type[ModelT],
+        validator: Optional[TypeAdapter[ModelT]] = None,
+        **kwargs
+    ) -> ModelT:
+        """Make a request and validate the response body straight into ``model_cls``."""
+        response = await self._request(method, endpoint, **kwargs)
+        return _build_model(response, model_cls, self.trust_server, validator)
+
+    async def _request_adapter(self, method: str, endpoint: str, annotation: Any, adapter: TypeAdapter[T], **kwargs) -> T:
+        """Make a request and build the response body as ``annotation``. See ``TrendsAGIClient._request_adapter``."""
+        response = await self._request(method, endpoint, **kwargs)
+        if self.trust_server:
+            return _fast_build(annotation, _json_loads(response.content))
+        return adapter.validate_json(response.content)
+
+    async def _iter_items(
+        self, endpoint: str, prefix: str, model_cls: Type[ModelT], adapter: TypeAdapter[ModelT], **kwargs
+    ) -> AsyncIterator[ModelT]:
+        """Stream a GET response and yield the items under ``prefix`` as they are parsed."""
+        parser = _ItemStream(prefix)
+        try:
+            async with self._session.stream('GET', endpoint, **kwargs) as response:
+                if not 200 <= response.status_code < 300:
+                    await response.aread()
+                    _handle_response(response)
+                async for chunk in response.aiter_bytes():
+                    for item in parser.feed(chunk):
+                        yield _build_item(model_cls, adapter, item, self.trust_server)
+        except httpx.HTTPError as e:
+            raise exceptions.TrendsAGIError(f"Network error communicating with API: {e}")
+        for item in parser.close():
+            yield _build_item(model_cls, adapter, item, self.trust_server)
+
+    async def _stream_events(
+        self, method: str, endpoint: str, model_cls: Type[ModelT],
+        fallback: Optional[Callable[[bytes], ModelT]] = None, **kwargs
+    ) -> AsyncIterator[ModelT]:
+        """
+        Make a server-sent-events request and yield each event's data as ``model_cls``.
+
+        See ``TrendsAGIClient._stream_events`` for how non-streaming replies are handled.
+        """
+        kwargs = _encode_body(kwargs)
+        kwargs['headers'] = {**kwargs.get('headers', {}), **_SSE_HEADERS}
+        parser = _SSEParser()
+        try:
+            async with self._session.stream(method, endpoint, **kwargs) as response:
+                if not 200 <= response.status_code < 300:
+                    await response.aread()
+                    _handle_response(response)
+                if not _is_event_stream(response):
+                    await response.aread()
+                    if fallback is None:
+                        raise exceptions.TrendsAGIError(
+                            "Expected a text/event-stream response, got "
+                            f"{response.headers.get('Content-Type')!r}"
+                        )
+                    yield fallback(response.content)
+                    return
+                async for line in response.aiter_lines():
+                    data = parser.feed(line)
+                    if data == "[DONE]":
+                        return
+                    if data is not None:
+                        yield _build_event(model_cls, data, self.trust_server)
+                data = parser.close()
+        except httpx.HTTPError as e:
+            raise exceptions.TrendsAGIError(f"Network error communicating with API: {e}")
+        if data is not None and data != "[DONE]":
+            yield _build_event(model_cls, data, self.trust_server)
+
+    async def _fan_out(self, func: Callable[[Any], Awaitable[T]], args: Iterable[Any], max_workers: int) -> List[T]:
+        """
+        Await ``func`` once per argument, at most ``max_workers`` at a time, and return the results in order.
+
+        The async counterpart of ``TrendsAGIClient._fan_out``: the first exception raised is
+        propagated and the remaining calls are cancelled.
+        """
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def call(arg: Any) -> T:
+            async with semaphore:
+                return await func(arg)
+
+        tasks = [asyncio.ensure_future(call(arg)) for arg in args]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    # --- Trends & Insights Methods ---
+
+    async def get_trends(
+        self,
+        search: Optional[str] = None,
+        sort_by: str = 'volume',
+        order: str = 'desc',
+        limit: int = 20,
+        offset: int = 0,
+        period: str = '24h',
+        category: Optional[str] = None
+    ) -> models.TrendListResponse:
+        """
+        Retrieve a list of currently trending topics.
+        """
+        params = _drop_none(
+            search=search, sort_by=sort_by, order=order, limit=limit,
+            offset=offset, period=period, category=category
+        )
+        return await self._request_model('GET', '/api/trends', models.TrendListResponse, params=params)
+
+    def iter_trends(
+        self,
+        search: Optional[str] = None,
+        sort_by: str = 'volume',
+        order: str = 'desc',
+        limit: int = 20,
+        offset: int = 0,
+        period: str = '24h',
+        category: Optional[str] = None
+    ) -> AsyncIterator[models.TrendItem]:
+        """
+        Like :meth:`get_trends`, but stream the response and yield each trend as it is parsed.
+
+        Use with ``async for``. Requires ``pip install trendsagi[stream]``.
+        """
+        params = _drop_none(
+            search=search, sort_by=sort_by, order=order, limit=limit,
+            offset=offset, period=period, category=category
+        )
+        return self._iter_items('/api/trends', 'trends.item', models.TrendItem, _validators.TREND_ITEM, params=params)
+        
+    @_ttl_cached(seconds=60)
+    async def get_trend_details(self, trend_id: int, use_cache: bool = True) -> models.TrendDetail:
+        """
+        Retrieve detailed information for a single trend, including associated tweets.
+
+        Results are cached briefly; pass ``use_cache=False`` to force a fresh request.
+        """
+        return await self._request_model('GET', f'/api/trends/{trend_id}', models.TrendDetail)
+
+    async def get_trend_details_many(self, trend_ids: Iterable[int], max_workers: int = 16) -> List[models.TrendDetail]:
+        """
+        Retrieve details for several trends concurrently, returned in the order of ``trend_ids``.
+        """
+        return await self._fan_out(self.get_trend_details, trend_ids, max_workers)
+
+    async def get_trend_analytics(self, trend_id: int, period: str = '7d', start_date: Optional[str] = None, end_date: Optional[str] = None) -> models.TrendAnalytics:
+        """
+        Retrieve historical data points for a specific trend.
+        """
+        params = _drop_none(period=period, start_date=start_date, end_date=end_date)
+        return await self._request_model('GET', f'/api/trends/{trend_id}/analytics', models.TrendAnalytics, params=params)
+
+    async def search_insights(
+        self,
+        key_theme_contains: Optional[str] = None,
+        audience_keyword: Optional[str] = None,
+        angle_contains: Optional[str] = None,
+        sentiment_category: Optional[str] = None,
+        overall_topic_category_llm: Optional[str] = None,
+        trend_name_contains: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0,
+        sort_by: str = 'timestamp',
+        order: str = 'desc'
+    ) -> models.InsightSearchResponse:
+        """
+        Search for trends based on the content of their AI-generated insights.
+        """
+        params = _drop_none(
+            keyThemeContains=key_theme_contains, audienceKeyword=audience_keyword,
+            angleContains=angle_contains, sentimentCategory=sentiment_category,
+            overallTopicCategoryLlm=overall_topic_category_llm, trendNameContains=trend_name_contains,
+            limit=limit, offset=offset, sort_by=sort_by, order=order
+        )
+        return await self._request_model('GET', '/api/insights/search', models.InsightSearchResponse, params=params)
+
+    def iter_insights(
+        self,
+        key_theme_contains: Optional[str] = None,
+        audience_keyword: Optional[str] = None,
+        angle_contains: Optional[str] = None,
+        sentiment_category: Optional[str] = None,
+        overall_topic_category_llm: Optional[str] = None,
+        trend_name_contains: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0,
+        sort_by: str = 'timestamp',
+        order: str = 'desc'
+    ) -> AsyncIterator[models.TrendSearchResultItem]:
+        """
+        Like :meth:`search_insights`, but stream the response and yield each result as it is parsed.
+
+        Use with ``async for``. Requires ``pip install trendsagi[stream]``.
+        """
+        params = _drop_none(
+            keyThemeContains=key_theme_contains, audienceKeyword=audience_keyword,
+            angleContains=angle_contains, sentimentCategory=sentiment_category,
+            overallTopicCategoryLlm=overall_topic_category_llm, trendNameContains=trend_name_contains,
+            limit=limit, offset=offset, sort_by=sort_by, order=order
+        )
+        return self._iter_items('/api/insights/search', 'trends.item', models.TrendSearchResultItem, _validators.TREND_SEARCH_RESULT_ITEM, params=params)
+        
+    async def get_ai_insights(self, trend_id: int, force_refresh: bool = False) -> Optional[models.AIInsight]:
+        """
+        Get or generate AI-powered insights for a specific trend.
+        """
+        response_data = await self._request_json('GET', f'/api/trends/{trend_id}/ai-insights', params={"force_refresh": force_refresh})
+        if not response_data:
+            return None
+        return _build_item(models.AIInsight, _validators.AI_INSIGHT, response_data, self.trust_server)
+
+    # --- Custom Reports Methods ---
+
+    async def generate_custom_report(
+        self, report_request: Union[Dict[str, Any], models.CustomReportRequest]
+    ) -> models.CustomReport:
+        """
+        Generate a custom report based on specified dimensions, metrics, and filters.
+
+        ``report_request`` is validated against :class:`~trendsagi.models.CustomReportRequest`
+        before it is sent; an invalid request raises ``ValueError`` without a network call.
+        """
+        content = _encode_request(_validators.CUSTOM_REPORT_REQUEST, report_request, exclude_unset=True)
+        return await self._request_model('POST', '/api/reports/custom', models.CustomReport, content=content)
+        
+    # --- Intelligence Suite Methods ---
+
+    async def get_recommendations(
+        self,
+        limit: int = 10, offset: int = 0, recommendation_type: Optional[str] = None,
+        source_trend_query: Optional[str] = None, priority: Optional[str] = None, status: str = 'new'
+    ) -> models.RecommendationListResponse:
+        """
+        Get actionable recommendations generated for the user.
+        """
+        params = _drop_none(
+            limit=limit, offset=offset, type=recommendation_type, 
+            sourceTrendQ=source_trend_query, priority=priority, status=status
+        )
+        return await self._request_model('GET', '/api/intelligence/recommendations', models.RecommendationListResponse, params=params)
+
+    async def perform_recommendation_action(self, recommendation_id: int, action: Optional[str] = None, feedback: Optional[str] = None) -> models.Recommendation:
+        """
+        Update a recommendation's status or provide feedback.
+        """
+        if action and feedback:
+            raise ValueError("Only one of 'action' or 'feedback' can be provided at a time.")
+        if not action and not feedback:
+            raise ValueError("Either 'action' or 'feedback' must be provided.")
+
+        payload = {"action": action, "feedback": feedback}
+        content = _encode_request(_validators.RECOMMENDATION_ACTION_REQUEST, payload, exclude_none=True)
+        return await self._request_model('POST', f'/api/intelligence/recommendations/{recommendation_id}/action', models.Recommendation, content=content)
+
+    async def get_tracked_x_users(self, q: Optional[str] = None, min_followers: Optional[int] = None, sort_by: str = 'name_asc') -> models.MarketEntityListResponse:
+        """
+        Get a list of tracked X Users.
+        """
+        params = _drop_none(q=q, min_followers=min_followers, sort_by=sort_by)
+        return await self._request_model('GET', '/api/intelligence/market/x-users', models.MarketEntityListResponse, params=params)
+
+    async def get_tracked_x_user(self, entity_id: int) -> models.MarketEntity:
+        """
+        Retrieve a single tracked X User by their unique entity ID.
+        """
+        return await self._request_model('GET', f'/api/intelligence/market/x-users/{entity_id}', models.MarketEntity)
+
+    async def get_tracked_x_user_many(self, entity_ids: Iterable[int], max_workers: int = 16) -> List[models.MarketEntity]:
+        """
+        Retrieve several tracked X Users concurrently, returned in the order of ``entity_ids``.
+        """
+        return await self._fan_out(self.get_tracked_x_user, entity_ids, max_workers)
+
+    async def create_tracked_x_user(self, handle: str, name: Optional[str] = None, description: Optional[str] = None, notes: Optional[str] = None) -> models.MarketEntity:
+        """
+        Add a new X User to track.
+        """
+        payload = {"handle": handle, "name": name, "description": description, "notes": notes}
+        payload = {k: v for k, v in payload.items() if v is not None}
+        return await self._request_model('POST', '/api/intelligence/market/x-users', models.MarketEntity, json=payload)
+        
+    async def update_tracked_x_user(self, entity_id: int, updates: Dict[str, Any]) -> models.MarketEntity:
+        """
+        Update details of a tracked X User.
+        """
+        return await self._request_model('PUT', f'/api/intelligence/market/x-users/{entity_id}', models.MarketEntity, json=updates)
+
+    async def delete_tracked_x_user(self, entity_id: int) -> None:
+        """Stop tracking an X User."""
+        await self._request_status('DELETE', f'/api/intelligence/market/x-users/{entity_id}')
+
+    async def get_crisis_events(
+        self,
+        limit: int = 10, offset: int = 0, status: str = 'active', keyword: Optional[str] = None,
+        severity: Optional[str] = None, time_range: str = '24h',
+        start_date: Optional[str] = None, end_date: Optional[str] = None
+    ) -> models.CrisisEventListResponse:
+        """
+        Get crisis events detected for the user.
+        """
+        params = _drop_none(
+            limit=limit, offset=offset, status=status, keyword=keyword, 
+            severity=severity, timeRange=time_range, startDate=start_date, endDate=end_date
+        )
+        return await self._request_model('GET', '/api/intelligence/crisis-events', models.CrisisEventListResponse, params=params)
+
+    async def get_crisis_event(self, event_id: int) -> models.CrisisEvent:
+        """
+        Retrieve a single crisis event by its unique ID.
+        """
+        return await self._request_model('GET', f'/api/intelligence/crisis-events/{event_id}', models.CrisisEvent)
+
+    async def get_crisis_event_many(self, event_ids: Iterable[int], max_workers: int = 16) -> List[models.CrisisEvent]:
+        """
+        Retrieve several crisis events concurrently, returned in the order of ``event_ids``.
+        """
+        return await self._fan_out(self.get_crisis_event, event_ids, max_workers)
+
+    async def perform_crisis_event_action(self, event_id: int, action: str) -> models.CrisisEvent:
+        """
+        Update the status of a crisis event (e.g., "acknowledge", "archive").
+        """
+        return await self._request_model('POST', f'/api/intelligence/crisis-events/{event_id}/action', models.CrisisEvent, json={"action": action})
+
+    async def perform_deep_analysis(self, query: str, force_refresh: bool = False) -> models.DeepAnalysis:
+        """
+        Perform deep AI analysis on a topic.
+        """
+        return await self._request_model('POST', '/api/intelligence/deep-analysis', models.DeepAnalysis, json={"query": query, "force_refresh": force_refresh})
+
+    def perform_deep_analysis_stream(self, query: str, force_refresh: bool = False) -> AsyncIterator[models.DeepAnalysisChunk]:
+        """
+        Perform deep AI analysis on a topic, yielding partial updates as the server produces them.
+
+        Use with ``async for``. If the server does not stream, its regular JSON reply is
+        yielded as a single ``complete`` chunk.
+        """
+        return self._stream_events(
+            'POST', '/api/intelligence/deep-analysis', models.DeepAnalysisChunk,
+            fallback=lambda body: _complete_analysis_chunk(body, self.trust_server),
+            json={"query": query, "force_refresh": force_refresh}
+        )
+        
+    # --- User & Account Management Methods (Non-sensitive) ---
+
+    async def get_topic_interests(self) -> List[models.TopicInterest]:
+        """Retrieve the list of topic interests tracked by the user."""
+        return await self._request_adapter('GET', '/api/user/topic-interests', List[models.TopicInterest], _validators.TOPIC_INTEREST_LIST)
+
+    async def create_topic_interest(
+        self,
+        keyword: str, alert_condition_type: str,
+        volume_threshold_value: Optional[int] = None, percentage_growth_value: Optional[float] = None
+    ) -> models.TopicInterest:
+        """
+        Create a new topic interest.
+        """
+        payload = {
+            "keyword": keyword, "alert_condition_type": alert_condition_type,
+            "volume_threshold_value": volume_threshold_value, "percentage_growth_value": percentage_growth_value
+        }
+        payload = {k: v for k, v in payload.items() if v is not None}
+        return await self._request_model('POST', '/api/user/topic-interests', models.TopicInterest, json=payload)
+        
+    async def delete_topic_interest(self, interest_id: int) -> None:
+        """Delete a specific topic interest."""
+        await self._request_status('DELETE', f'/api/user/topic-interests/{interest_id}')
+
+    async def get_export_settings(self) -> List[models.ExportConfiguration]:
+        """Get all of the user's data export configurations."""
+        return await self._request_adapter('GET', '/api/user/export/settings', List[models.ExportConfiguration], _validators.EXPORT_CONFIG_LIST)
+
+    async def save_export_settings(
+        self,
+        destination: str, config: Dict[str, Any], schedule: str = "none",
+        schedule_time: Optional[str] = None, is_active: bool = False, config_id: Optional[int] = None
+    ) -> models.ExportConfiguration:
+        """
+        Create or update an export configuration.
+
+        The configuration is validated locally first; invalid values raise ``ValueError``.
+        """
+        payload = {
+            "id": config_id, "destination": destination, "config": config,
+            "schedule": schedule, "schedule_time": schedule_time, "is_active": is_active,
+        }
+        content = _encode_request(_validators.EXPORT_CONFIG_REQUEST, payload, exclude_none=True)
+        return await self._request_model('POST', '/api/user/export/settings', models.ExportConfiguration, content=content)
+
+    async def delete_export_setting(self, config_id: int) -> None:
+        """Delete an export configuration."""
+        await self._request_status('DELETE', f'/api/user/export/settings/{config_id}')
+
+    async def get_export_history(self, limit: int = 15, offset: int = 0) -> models.ExportHistoryResponse:
+        """Get the user's export execution history."""
+        return await self._request_model('GET', '/api/user/export/history', models.ExportHistoryResponse, params={"limit": limit, "offset": offset})
+
+    async def run_export_now(self, config_id: int) -> models.ExportExecutionLog:
+        """Trigger an immediate export."""
+        return await self._request_model('POST', f'/api/user/export/configurations/{config_id}/run-now', models.ExportExecutionLog)
+        
+    async def get_dashboard_stats(self) -> models.DashboardStats:
+        """Get key statistics for the user's dashboard."""
+        return await self._request_model('GET', '/api/user/dashboard/stats', models.DashboardStats, _validators.DASHBOARD_STATS)
+
+    async def get_recent_notifications(self, limit: int = 10) -> models.NotificationListResponse:
+        """Get recent notifications for the user."""
+        return await self._request_model(
+            'GET', '/api/user/notifications/recent', models.NotificationListResponse,
+            _validators.NOTIFICATION_LIST, params={"limit": limit}
+        )
+
+    async def mark_notifications_read(self, ids: Optional[List[int]] = None, parse: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Mark notifications as read. If ids is None, marks all as read.
+
+        Pass ``parse=False`` to skip decoding the acknowledgement body and return None.
+        """
+        payload = {"ids": ids if ids is not None else []}
+        if not parse:
+            await self._request_status('POST', '/api/user/notifications/mark-read', json=payload)
+            return None
+        return await self._request_json('POST', '/api/user/notifications/mark-read', json=payload)
+
+    # --- Public Information & Status Methods ---
+    
+    @_ttl_cached(seconds=3600)
+    async def get_available_plans(self, use_cache: bool = True) -> List[models.SubscriptionPlan]:
+        """
+        Retrieve a list of all publicly available subscription plans.
+
+        Results are cached; pass ``use_cache=False`` to force a fresh request.
+        """
+        return await self._request_adapter('GET', '/api/plans', List[models.SubscriptionPlan], _validators.PLAN_LIST)
+
+    @_ttl_cached(seconds=60)
+    async def get_api_status(self, use_cache: bool = True) -> models.StatusPage:
+        """
+        Retrieve the current operational status of the API and its components.
+
+        Results are cached briefly; pass ``use_cache=False`` to force a fresh request.
+        """
+        return await self._request_model('GET', '/api/status', models.StatusPage)
+        
+    @_ttl_cached(seconds=300)
+    async def get_api_status_history(self, use_cache: bool = True) -> models.StatusHistoryResponse:
+        """
+        Retrieve the 90-day uptime history for all API components.
+
+        Results are cached briefly; pass ``use_cache=False`` to force a fresh request.
+        """
+        return await self._request_model('GET', '/api/status-history', models.StatusHistoryResponse)
@@ -1,59 +1,664 @@
-import requests
-from typing import Optional, List, Dict, Any
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import functools
+import inspect
+import json
+import math
+import uuid
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+import httpx
+from typing import Optional, List, Dict, Any, Callable, Iterable, Iterator, Tuple, Type, TypeVar, Union, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
 
 from . import models
 from . import exceptions
+from . import _validators
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+T = TypeVar("T")
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+if orjson is not None:
+    def _json_dumps(obj: Any) -> bytes:
+        """Encode a request body to JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    _json_loads = orjson.loads
+else:
+    def _jsonable(obj: Any) -> Any:
+        """Coerce ``obj`` the way orjson would: ISO dates, str UUIDs, dict dataclasses, NaN as null."""
+        if isinstance(obj, float):
+            return obj if math.isfinite(obj) else None
+        if isinstance(obj, dict):
+            return {_jsonable_key(k): _jsonable(v) for k, v in obj.items()}
+        if isinstance(obj, (list, tuple)):
+            return [_jsonable(v) for v in obj]
+        if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+            return obj.isoformat()
+        if isinstance(obj, uuid.UUID):
+            return str(obj)
+        if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            return _jsonable({f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)})
+        return obj
+
+    def _jsonable_key(key: Any) -> Any:
+        """Coerce a dict key the way ``orjson.OPT_NON_STR_KEYS`` would."""
+        if isinstance(key, (str, int, bool)) or key is None:
+            return key
+        if isinstance(key, float):
+            return key if math.isfinite(key) else "null"
+        return str(_jsonable(key))
+
+    def _json_dumps(obj: Any) -> bytes:
+        """Encode a request body to JSON bytes."""
+        return json.dumps(_jsonable(obj), separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+    _json_loads = json.loads
+
+
+def _drop_none(**params: Any) -> List[Tuple[str, Any]]:
+    """Build query params as ``(key, value)`` pairs, leaving out anything that is None."""
+    return [(k, v) for k, v in params.items() if v is not None]
+
+
+def _encode_request(adapter: TypeAdapter[Any], data: Any, **dump_kwargs: Any) -> bytes:
+    """
+    Validate a request body locally and dump it straight to JSON bytes.
+
+    Invalid payloads raise pydantic's ``ValidationError`` (a ``ValueError``) before any
+    network round-trip, instead of coming back from the server as a 400.
+    """
+    return adapter.dump_json(adapter.validate_python(data), **dump_kwargs)
+
+
+# Only requests that carry a body declare a Content-Type; the session itself does not.
+_JSON_BODY_HEADERS = {"Content-Type": "application/json"}
+
+
+def _encode_body(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Replace a ``json=`` request argument with pre-encoded ``content=`` bytes.
+
+    Requests with a body also get the JSON ``Content-Type`` header.
+    """
+    if 'json' in kwargs:
+        kwargs['content'] = _json_dumps(kwargs.pop('json'))
+    if 'content' in kwargs:
+        kwargs['headers'] = {**_JSON_BODY_HEADERS, **kwargs.get('headers', {})}
+    return kwargs
+
+
+def _fast_build(annotation: Any, data: Any) -> Any:
+    """
+    Build ``annotation`` from decoded JSON using ``model_construct``, skipping validation.
+
+    Nested models are constructed recursively by following the field annotations
+    through ``List[...]``, ``Dict[..., ...]`` and ``Optional[...]``. Scalars are passed
+    through untouched, so e.g. datetimes stay as the ISO strings sent by the server.
+    """
+    if data is None:
+        return None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        if not isinstance(data, dict):
+            return data
+        values = {}
+        for name, field in annotation.model_fields.items():
+            key = field.alias if field.alias is not None and field.alias in data else name
+            if key in data:
+                values[name] = _fast_build(field.annotation, data[key])
+        return annotation.model_construct(**values)
+
+    origin = get_origin(annotation)
+    if origin is list and isinstance(data, list):
+        args = get_args(annotation)
+        item_type = args[0] if args else Any
+        return [_fast_build(item_type, item) for item in data]
+    if origin is dict and isinstance(data, dict):
+        args = get_args(annotation)
+        value_type = args[1] if args else Any
+        return {k: _fast_build(value_type, v) for k, v in data.items()}
+    if origin is Union:
+        for arg in get_args(annotation):
+            if arg is not type(None):
+                return _fast_build(arg, data)
+    return data
+
+
+# Transient statuses worth retrying on the same warm connection. 429 means the request was
+# not processed, so it is retried for every method; 5xx only for idempotent methods.
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE"})
+_BACKOFF_FACTOR = 0.3
+# Longest we will sleep between retries; a longer Retry-After is raised to the caller instead.
+_MAX_BACKOFF = 30.0
+
+
+def _session_options(
+    api_key: str, base_url: str, max_pool: int, timeout: Optional[float],
+) -> Dict[str, Any]:
+    """
+    Keyword arguments shared by the sync and async ``httpx`` clients.
+
+    No explicit transport is passed so ``HTTP(S)_PROXY``/``NO_PROXY`` from the
+    environment keep working; retries happen in ``_request``. Up to ``max_pool``
+    connections are kept alive for reuse, and at most ``max(100, max_pool)`` are
+    open at once (httpx's own default ceiling); callers beyond that wait for one.
+    """
+    return {
+        "base_url": base_url,
+        "headers": {
+            "X-API-Key": api_key,
+            "Accept": "application/json",
+            # Large list responses compress well; httpx decodes both transparently.
+            "Accept-Encoding": "gzip, br",
+        },
+        "http2": True,
+        "limits": httpx.Limits(max_keepalive_connections=max_pool, max_connections=max(100, max_pool)),
+        "timeout": timeout,
+        "follow_redirects": True,
+    }
+
+
+def _should_retry(method: str, response: httpx.Response) -> bool:
+    """Whether ``response`` is a transient failure that is safe to retry for ``method``."""
+    if response.status_code not in _RETRY_STATUSES:
+        return False
+    return response.status_code == 429 or method.upper() in _IDEMPOTENT_METHODS
+
+
+def _backoff(attempt: int) -> float:
+    """Exponential backoff for retry number ``attempt`` (0-based), capped at ``_MAX_BACKOFF``."""
+    return min(_MAX_BACKOFF, _BACKOFF_FACTOR * (2 ** attempt))
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> Optional[float]:
+    """
+    Seconds to wait before retry number ``attempt`` (0-based), honouring ``Retry-After``.
+
+    Returns None when the server asks for longer than ``_MAX_BACKOFF``, in which case
+    the response should be raised (e.g. as ``RateLimitError``) rather than slept on.
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            delay = max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        else:
+            return delay if delay <= _MAX_BACKOFF else None
+    return _backoff(attempt)
+
+
+# Maps error status codes to the exception raised for them; anything missing is a plain APIError.
+_STATUS_EXC: Dict[int, Type[exceptions.APIError]] = {
+    401: exceptions.AuthenticationError,
+    404: exceptions.NotFoundError,
+    409: exceptions.ConflictError,
+    429: exceptions.RateLimitError,
+}
+
+
+def _handle_response(response: httpx.Response) -> httpx.Response:
+    """Return ``response`` if it is a 2xx, otherwise raise the matching exception."""
+    if 200 <= response.status_code < 300:
+        return response
+
+    # Decode the error body once; fall back to the raw text when it is not a JSON object.
+    body = response.content
+    try:
+        payload = _json_loads(body)
+    except ValueError:
+        payload = None
+    if isinstance(payload, dict) and 'detail' in payload:
+        error_detail = payload['detail']
+    else:
+        error_detail = body.decode('utf-8', 'replace')
+
+    exc_cls = _STATUS_EXC.get(response.status_code, exceptions.APIError)
+    raise exc_cls(response.status_code, error_detail)
+
+
+def _build_model(
+    response: httpx.Response,
+    model_cls: Type[ModelT],
+    trust_server: bool,
+    validator: Optional[TypeAdapter[ModelT]] = None,
+) -> ModelT:
+    """
+    Turn a successful response into ``model_cls``, validating unless the server is trusted.
+
+    ``validator`` is an optional prebuilt adapter for ``model_cls``, used instead of the
+    ``model_validate_json`` classmethod on hot polling endpoints.
+    """
+    if trust_server:
+        return _fast_build(model_cls, _json_loads(response.content))
+    if validator is not None:
+        return validator.validate_json(response.content)
+    return model_cls.model_validate_json(response.content)
+
+
+def _build_item(model_cls: Type[ModelT], adapter: TypeAdapter[ModelT], data: Dict[str, Any], trust_server: bool) -> ModelT:
+    """Turn one decoded item from a streamed response into ``model_cls`` using its prebuilt ``adapter``."""
+    if trust_server:
+        return _fast_build(model_cls, data)
+    return adapter.validate_python(data)
+
+
+class _ItemStream:
+    """
+    Incremental JSON parser yielding the elements of one array inside a response body.
+
+    Bytes are pushed in with :meth:`feed` as they arrive and every fully parsed item
+    under ``prefix`` (an ``ijson`` path such as ``"trends.item"``) is returned straight
+    away, so only one item is ever held in memory. Works for sync and async bodies alike.
+    """
+    def __init__(self, prefix: str):
+        if ijson is None:
+            raise ImportError(
+                "Streaming responses requires the optional 'ijson' package. "
+                "Install it with: pip install trendsagi[stream]"
+            )
+        self._items: List[Dict[str, Any]] = ijson.sendable_list()
+        self._coro = ijson.items_coro(self._items, prefix, use_float=True)
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        items = list(self._items)
+        del self._items[:]
+        return items
+
+    def feed(self, chunk: bytes) -> List[Dict[str, Any]]:
+        self._coro.send(chunk)
+        return self._drain()
+
+    def close(self) -> List[Dict[str, Any]]:
+        self._coro.close()
+        return self._drain()
+
+
+_MISSING = object()
+
+
+class _TTLCache:
+    """
+    A minimal in-process cache of ``{key: (expires_at, value)}`` on the monotonic clock.
+
+    Holds at most ``maxsize`` entries: expired ones are pruned on every ``set`` and, if it
+    is still full, the oldest entry is evicted. Safe to share between threads; the lock is
+    only held for the dict operations.
+    """
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[Any, ...]) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return _MISSING
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return _MISSING
+            return value
+
+    def set(self, key: Tuple[Any, ...], value: Any, ttl: float) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._data.pop(key, None)
+            expired = [k for k, (expires_at, _) in self._data.items() if expires_at <= now]
+            for k in expired:
+                del self._data[k]
+            while len(self._data) >= self.maxsize:
+                # Dicts keep insertion order, so the first key is the oldest entry.
+                del self._data[next(iter(self._data))]
+            self._data[key] = (now + ttl, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+def _ttl_cached(seconds: float) -> Callable[[F], F]:
+    """
+    Cache a client method's result for ``seconds``, keyed on its arguments.
+
+    The decorated method must accept a ``use_cache: bool = True`` keyword, which the
+    decorator reads: ``use_cache=False`` skips the lookup but still stores the fresh
+    result. The client's ``cache_ttl``, when set, overrides ``seconds`` (0 disables
+    caching). Arguments are bound to the method's signature first, so ``f(5)`` and
+    ``f(trend_id=5)`` share an entry. Cache hits return the already-built model itself,
+    shared with every other caller, so there is no network round-trip and no validation;
+    lists are returned as a fresh list of those shared models. Works for both plain and
+    ``async def`` methods.
+    """
+    def decorator(func: F) -> F:
+        name = func.__name__
+        signature = inspect.signature(func)
+
+        def lookup(client: Any, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Tuple[Any, float, Any]:
+            ttl = seconds if client.cache_ttl is None else client.cache_ttl
+            bound = signature.bind(client, *args, **kwargs)
+            bound.apply_defaults()
+            use_cache = bound.arguments.pop("use_cache")
+            key = (name,) + tuple(bound.arguments.items())[1:]
+            return key, ttl, (client._cache.get(key) if use_cache and ttl > 0 else _MISSING)
+
+        def share(value: Any) -> Any:
+            return list(value) if isinstance(value, list) else value
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                key, ttl, value = lookup(self, args, kwargs)
+                if value is _MISSING:
+                    value = await func(self, *args, **kwargs)
+                    if ttl > 0:
+                        self._cache.set(key, value, ttl)
+                return share(value)
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            key, ttl, value = lookup(self, args, kwargs)
+            if value is _MISSING:
+                value = func(self, *args, **kwargs)
+                if ttl > 0:
+                    self._cache.set(key, value, ttl)
+            return share(value)
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
+_SSE_HEADERS = {"Accept": "text/event-stream"}
+
+
+class _SSEParser:
+    """
+    Line-by-line parser for ``text/event-stream`` bodies.
+
+    :meth:`feed` takes one line (without the newline) and returns the event's ``data``
+    payload once the blank line ending the event arrives, or None otherwise. Multi-line
+    ``data:`` fields are joined with newlines; comments and other fields are ignored.
+    """
+    def __init__(self):
+        self._data: List[str] = []
+
+    def feed(self, line: str) -> Optional[str]:
+        if not line:
+            if not self._data:
+                return None
+            data = "\n".join(self._data)
+            self._data = []
+            return data
+        if line.startswith("data:"):
+            value = line[5:]
+            self._data.append(value[1:] if value.startswith(" ") else value)
+        return None
+
+    def close(self) -> Optional[str]:
+        return self.feed("")
+
+
+def _build_event(model_cls: Type[ModelT], data: Union[str, bytes], trust_server: bool) -> ModelT:
+    """Turn one SSE ``data`` payload into ``model_cls``."""
+    if trust_server:
+        return _fast_build(model_cls, _json_loads(data))
+    return model_cls.model_validate_json(data)
+
+
+def _is_event_stream(response: httpx.Response) -> bool:
+    """Whether the server actually answered with ``text/event-stream``."""
+    content_type = response.headers.get("Content-Type", "")
+    return content_type.split(";", 1)[0].strip().lower() == "text/event-stream"
+
+
+def _complete_analysis_chunk(body: bytes, trust_server: bool) -> models.DeepAnalysisChunk:
+    """Wrap a plain JSON ``DeepAnalysis`` body as the single ``complete`` chunk of a stream."""
+    analysis = _build_event(models.DeepAnalysis, body, trust_server)
+    return models.DeepAnalysisChunk.model_construct(event="complete", analysis=analysis)
+
 
 class TrendsAGIClient:
     """
     The main client for interacting with the TrendsAGI API.
+
+    A single client is safe to share between threads and that is the intended way to
+    make parallel calls: every thread reuses the same pool of warm HTTP/2 connections,
+    whereas a client per thread would each pay for its own TCP/TLS handshakes.
     
     :param api_key: Your TrendsAGI API key, generated from your profile page.
     :param base_url: The base URL of the TrendsAGI API. Defaults to the production URL.
                      Override this for development or testing against a local server.
                      Example for local dev: base_url="http://localhost:8000"
+    :param trust_server: If True, responses are built with ``model_construct`` instead of being
+                         validated. This is considerably faster for large pages, but it BYPASSES
+                         ALL VALIDATION: fields are not type-checked or coerced (datetimes stay
+                         strings), and malformed payloads are not rejected. Only enable this when
+                         talking to the official TrendsAGI API endpoint.
+    :param max_retries: How many times to retry failed connections and transient 429/5xx
+                        responses (5xx only for GET/PUT/DELETE) before giving up. Defaults to 3.
+    :param cache_ttl: Seconds to cache results of slow-changing GET endpoints (API status, plans,
+                      trend details). None (the default) uses a sensible TTL per endpoint; 0
+                      disables caching. Individual calls accept ``use_cache=False``.
+    :param max_pool: How many connections to keep alive for reuse. Size this to your
+                     concurrency ceiling (e.g. the ``max_workers`` of a thread pool sharing
+                     the client). Defaults to 32.
+    :param timeout: Seconds to wait on connect/read/write before giving up, or None (the default)
+                    to wait indefinitely. LLM-backed calls such as ``perform_deep_analysis`` can
+                    take well over a minute, so keep any limit generous.
     """
-    def __init__(self, api_key: str, base_url: str = "https://api.trendsagi.com"):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.trendsagi.com",
+        trust_server: bool = False,
+        max_retries: int = 3,
+        cache_ttl: Optional[float] = None,
+        max_pool: int = 32,
+        timeout: Optional[float] = None,
+    ):
         if not api_key:
-            raise exceptions.AuthenticationError("API key is required.")
+            raise exceptions.AuthenticationError(error_detail="API key is required.")
         
         self.base_url = base_url.rstrip('/')
-        self._session = requests.Session()
-        self._session.headers.update({
-            "X-API-Key": api_key,
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        })
+        self.trust_server = trust_server
+        self.max_retries = max_retries
+        self.cache_ttl = cache_ttl
+        self._cache = _TTLCache()
+        self._session = httpx.Client(
+            **_session_options(api_key, self.base_url, max_pool, timeout)
+        )
 
-    def _request(self, method: str, endpoint: str, **kwargs) -> Any:
-        """Internal helper for making API requests."""
-        url = f"{self.base_url}{endpoint}"
-        try:
-            response = self._session.request(method, url, **kwargs)
-            
-            if 200 <= response.status_code < 300:
-                if response.status_code == 204:
-                    return None
-                return response.json()
-            
+    def close(self) -> None:
+        """Close the underlying connection pool."""
+        self._session.close()
+
+    def clear_cache(self) -> None:
+        """Drop every cached response."""
+        self._cache.clear()
+
+    def __enter__(self) -> "TrendsAGIClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _request(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        """
+        Internal helper for making API requests.
+
+        Returns the raw response for 2xx status codes so callers can decide how
+        to decode the body; raises the matching exception for anything else.
+        Failed connections and transient failures (429/5xx) are retried with
+        exponential backoff, reusing the pooled connection. A ``Retry-After`` longer
+        than ``_MAX_BACKOFF`` is raised straight away instead of slept on.
+        """
+        kwargs = _encode_body(kwargs)
+        attempt = 0
+        while True:
             try:
-                error_detail = response.json().get('detail', response.text)
-            except requests.exceptions.JSONDecodeError:
-                error_detail = response.text
-                
-            if response.status_code == 401:
-                raise exceptions.AuthenticationError(error_detail)
-            if response.status_code == 404:
-                raise exceptions.NotFoundError(response.status_code, error_detail)
-            if response.status_code == 409:
-                raise exceptions.ConflictError(response.status_code, error_detail)
-            if response.status_code == 429:
-                raise exceptions.RateLimitError(response.status_code, error_detail)
-            
-            raise exceptions.APIError(response.status_code, error_detail)
-
-        except requests.exceptions.RequestException as e:
+                response = self._session.request(method, endpoint, **kwargs)
+            except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+                # Nothing reached the server, so this is safe to retry for any method.
+                if attempt < self.max_retries:
+                    time.sleep(_backoff(attempt))
+                    attempt += 1
+                    continue
+                raise exceptions.TrendsAGIError(f"Network error communicating with API: {e}")
+            except httpx.HTTPError as e:
+                raise exceptions.TrendsAGIError(f"Network error communicating with API: {e}")
+            if attempt < self.max_retries and _should_retry(method, response):
+                delay = _retry_delay(response, attempt)
+                if delay is not None:
+                    time.sleep(delay)
+                    attempt += 1
+                    continue
+            return _handle_response(response)
+
+    def _request_json(self, method: str, endpoint: str, **kwargs) -> Any:
+        """Make a request and return the decoded JSON body, or None for 204 responses."""
+        response = self._request(method, endpoint, **kwargs)
+        if response.status_code == 204:
+            return None
+        return _json_loads(response.content)
+
+    def _request_status(self, method: str, endpoint: str, **kwargs) -> int:
+        """Make a request whose body is not needed and return only the status code."""
+        response = self._request(method, endpoint, **kwargs)
+        return response.status_code
+
+    def _request_model(
+        self,
+        method: str,
+        endpoint: str,
+        model_cls: Type[ModelT],
+        validator: Optional[TypeAdapter[ModelT]] = None,
+        **kwargs
+    ) -> ModelT:
+        """
+        Make a request and validate the response body straight into ``model_cls``.
+
+        The raw bytes are handed to pydantic-core, which parses and validates in a
+        single pass instead of building an intermediate dict first. With
+        ``trust_server`` enabled, validation is skipped entirely.
+        """
+        response = self._request(method, endpoint, **kwargs)
+        return _build_model(response, model_cls, self.trust_server, validator)
+
+    def _request_adapter(self, method: str, endpoint: str, annotation: Any, adapter: TypeAdapter[T], **kwargs) -> T:
+        """
+        Make a request and validate the response body with ``adapter``, the prebuilt
+        ``TypeAdapter`` for ``annotation``. With ``trust_server`` enabled, ``annotation``
+        is built with ``model_construct`` instead.
+        """
+        response = self._request(method, endpoint, **kwargs)
+        if self.trust_server:
+            return _fast_build(annotation, _json_loads(response.content))
+        return adapter.validate_json(response.content)
+
+    def _iter_items(
+        self, endpoint: str, prefix: str, model_cls: Type[ModelT], adapter: TypeAdapter[ModelT], **kwargs
+    ) -> Iterator[ModelT]:
+        """
+        Stream a GET response and yield the items under ``prefix`` as they are parsed.
+
+        Requires the optional ``ijson`` dependency.
+        """
+        parser = _ItemStream(prefix)
+        try:
+            with self._session.stream('GET', endpoint, **kwargs) as response:
+                if not 200 <= response.status_code < 300:
+                    response.read()
+                    _handle_response(response)
+                for chunk in response.iter_bytes():
+                    for item in parser.feed(chunk):
+                        yield _build_item(model_cls, adapter, item, self.trust_server)
+        except httpx.HTTPError as e:
+            raise exceptions.TrendsAGIError(f"Network error communicating with API: {e}")
+        for item in parser.close():
+            yield _build_item(model_cls, adapter, item, self.trust_server)
+
+    def _stream_events(
+        self, method: str, endpoint: str, model_cls: Type[ModelT],
+        fallback: Optional[Callable[[bytes], ModelT]] = None, **kwargs
+    ) -> Iterator[ModelT]:
+        """
+        Make a server-sent-events request and yield each event's data as ``model_cls``.
+
+        A literal ``[DONE]`` payload ends the stream. If the server ignores the ``Accept``
+        header and answers with a regular body, it is passed to ``fallback`` and yielded
+        as the only event; without a ``fallback`` that raises ``TrendsAGIError``.
+        """
+        kwargs = _encode_body(kwargs)
+        kwargs['headers'] = {**kwargs.get('headers', {}), **_SSE_HEADERS}
+        parser = _SSEParser()
+        try:
+            with self._session.stream(method, endpoint, **kwargs) as response:
+                if not 200 <= response.status_code < 300:
+                    response.read()
+                    _handle_response(response)
+                if not _is_event_stream(response):
+                    response.read()
+                    if fallback is None:
+                        raise exceptions.TrendsAGIError(
+                            "Expected a text/event-stream response, got "
+                            f"{response.headers.get('Content-Type')!r}"
+                        )
+                    yield fallback(response.content)
+                    return
+                for line in response.iter_lines():
+                    data = parser.feed(line)
+                    if data == "[DONE]":
+                        return
+                    if data is not None:
+                        yield _build_event(model_cls, data, self.trust_server)
+                data = parser.close()
+        except httpx.HTTPError as e:
             raise exceptions.TrendsAGIError(f"Network error communicating with API: {e}")
+        if data is not None and data != "[DONE]":
+            yield _build_event(model_cls, data, self.trust_server)
+
+    def _fan_out(self, func: Callable[[Any], T], args: Iterable[Any], max_workers: int) -> List[T]:
+        """
+        Call ``func`` once per argument on a thread pool and return the results in order.
+
+        All threads share this client's connection pool, so the requests are multiplexed
+        over the existing HTTP/2 connection. As soon as one call fails, calls that have not
+        started yet are cancelled and that exception is propagated.
+        """
+        args = list(args)
+        if not args:
+            return []
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, len(args)))
+        futures = [executor.submit(func, arg) for arg in args]
+        try:
+            wait(futures, return_when=FIRST_EXCEPTION)
+            for future in futures:
+                if future.done() and future.exception() is not None:
+                    raise future.exception()  # type: ignore[misc]
+            return [future.result() for future in futures]
+        finally:
+            # No-ops on success; on failure (or Ctrl-C) stops queued calls from being sent.
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
 
     # --- Trends & Insights Methods ---
 
@@ -70,25 +675,55 @@ class TrendsAGIClient:
         """
         Retrieve a list of currently trending topics.
         """
-        params = {k: v for k, v in locals().items() if v is not None and k != 'self'}
-        response_data = self._request('GET', '/api/trends', params=params)
-        return models.TrendListResponse.model_validate(response_data)
+        params = _drop_none(
+            search=search, sort_by=sort_by, order=order, limit=limit,
+            offset=offset, period=period, category=category
+        )
+        return self._request_model('GET', '/api/trends', models.TrendListResponse, params=params)
+
+    def iter_trends(
+        self,
+        search: Optional[str] = None,
+        sort_by: str = 'volume',
+        order: str = 'desc',
+        limit: int = 20,
+        offset: int = 0,
+        period: str = '24h',
+        category: Optional[str] = None
+    ) -> Iterator[models.TrendItem]:
+        """
+        Like :meth:`get_trends`, but stream the response and yield each trend as it is parsed.
+
+        Keeps memory flat for large pages and lets processing start before the body has
+        fully arrived. Pagination metadata is not returned. Requires ``pip install trendsagi[stream]``.
+        """
+        params = _drop_none(
+            search=search, sort_by=sort_by, order=order, limit=limit,
+            offset=offset, period=period, category=category
+        )
+        return self._iter_items('/api/trends', 'trends.item', models.TrendItem, _validators.TREND_ITEM, params=params)
         
-    def get_trend_details(self, trend_id: int) -> models.TrendDetail:
+    @_ttl_cached(seconds=60)
+    def get_trend_details(self, trend_id: int, use_cache: bool = True) -> models.TrendDetail:
         """
         Retrieve detailed information for a single trend, including associated tweets.
+
+        Results are cached briefly; pass ``use_cache=False`` to force a fresh request.
         """
-        response_data = self._request('GET', f'/api/trends/{trend_id}')
-        return models.TrendDetail.model_validate(response_data)
+        return self._request_model('GET', f'/api/trends/{trend_id}', models.TrendDetail)
+
+    def get_trend_details_many(self, trend_ids: Iterable[int], max_workers: int = 16) -> List[models.TrendDetail]:
+        """
+        Retrieve details for several trends concurrently, returned in the order of ``trend_ids``.
+        """
+        return self._fan_out(self.get_trend_details, trend_ids, max_workers)
 
     def get_trend_analytics(self, trend_id: int, period: str = '7d', start_date: Optional[str] = None, end_date: Optional[str] = None) -> models.TrendAnalytics:
         """
         Retrieve historical data points for a specific trend.
         """
-        params = {"period": period, "start_date": start_date, "end_date": end_date}
-        params = {k: v for k, v in params.items() if v is not None}
-        response_data = self._request('GET', f'/api/trends/{trend_id}/analytics', params=params)
-        return models.TrendAnalytics.model_validate(response_data)
+        params = _drop_none(period=period, start_date=start_date, end_date=end_date)
+        return self._request_model('GET', f'/api/trends/{trend_id}/analytics', models.TrendAnalytics, params=params)
 
     def search_insights(
         self,
@@ -106,31 +741,62 @@ class TrendsAGIClient:
         """
         Search for trends based on the content of their AI-generated insights.
         """
-        params = {
-            "keyThemeContains": key_theme_contains, "audienceKeyword": audience_keyword,
-            "angleContains": angle_contains, "sentimentCategory": sentiment_category,
-            "overallTopicCategoryLlm": overall_topic_category_llm, "trendNameContains": trend_name_contains,
-            "limit": limit, "offset": offset, "sort_by": sort_by, "order": order
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-        response_data = self._request('GET', '/api/insights/search', params=params)
-        return models.InsightSearchResponse.model_validate(response_data)
+        params = _drop_none(
+            keyThemeContains=key_theme_contains, audienceKeyword=audience_keyword,
+            angleContains=angle_contains, sentimentCategory=sentiment_category,
+            overallTopicCategoryLlm=overall_topic_category_llm, trendNameContains=trend_name_contains,
+            limit=limit, offset=offset, sort_by=sort_by, order=order
+        )
+        return self._request_model('GET', '/api/insights/search', models.InsightSearchResponse, params=params)
+
+    def iter_insights(
+        self,
+        key_theme_contains: Optional[str] = None,
+        audience_keyword: Optional[str] = None,
+        angle_contains: Optional[str] = None,
+        sentiment_category: Optional[str] = None,
+        overall_topic_category_llm: Optional[str] = None,
+        trend_name_contains: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0,
+        sort_by: str = 'timestamp',
+        order: str = 'desc'
+    ) -> Iterator[models.TrendSearchResultItem]:
+        """
+        Like :meth:`search_insights`, but stream the response and yield each result as it is parsed.
+
+        Requires ``pip install trendsagi[stream]``.
+        """
+        params = _drop_none(
+            keyThemeContains=key_theme_contains, audienceKeyword=audience_keyword,
+            angleContains=angle_contains, sentimentCategory=sentiment_category,
+            overallTopicCategoryLlm=overall_topic_category_llm, trendNameContains=trend_name_contains,
+            limit=limit, offset=offset, sort_by=sort_by, order=order
+        )
+        return self._iter_items('/api/insights/search', 'trends.item', models.TrendSearchResultItem, _validators.TREND_SEARCH_RESULT_ITEM, params=params)
         
     def get_ai_insights(self, trend_id: int, force_refresh: bool = False) -> Optional[models.AIInsight]:
         """
         Get or generate AI-powered insights for a specific trend.
         """
-        response_data = self._request('GET', f'/api/trends/{trend_id}/ai-insights', params={"force_refresh": force_refresh})
-        return models.AIInsight.model_validate(response_data) if response_data else None
+        response_data = self._request_json('GET', f'/api/trends/{trend_id}/ai-insights', params={"force_refresh": force_refresh})
+        if not response_data:
+            return None
+        return _build_item(models.AIInsight, _validators.AI_INSIGHT, response_data, self.trust_server)
 
     # --- Custom Reports Methods ---
 
-    def generate_custom_report(self, report_request: Dict[str, Any]) -> models.CustomReport:
+    def generate_custom_report(
+        self, report_request: Union[Dict[str, Any], models.CustomReportRequest]
+    ) -> models.CustomReport:
         """
         Generate a custom report based on specified dimensions, metrics, and filters.
+
+        ``report_request`` is validated against :class:`~trendsagi.models.CustomReportRequest`
+        before it is sent; an invalid request raises ``ValueError`` without a network call.
         """
-        response_data = self._request('POST', '/api/reports/custom', json=report_request)
-        return models.CustomReport.model_validate(response_data)
+        content = _encode_request(_validators.CUSTOM_REPORT_REQUEST, report_request, exclude_unset=True)
+        return self._request_model('POST', '/api/reports/custom', models.CustomReport, content=content)
         
     # --- Intelligence Suite Methods ---
 
@@ -142,13 +808,11 @@ class TrendsAGIClient:
         """
         Get actionable recommendations generated for the user.
         """
-        params = {
-            "limit": limit, "offset": offset, "type": recommendation_type, 
-            "sourceTrendQ": source_trend_query, "priority": priority, "status": status
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-        response_data = self._request('GET', '/api/intelligence/recommendations', params=params)
-        return models.RecommendationListResponse.model_validate(response_data)
+        params = _drop_none(
+            limit=limit, offset=offset, type=recommendation_type, 
+            sourceTrendQ=source_trend_query, priority=priority, status=status
+        )
+        return self._request_model('GET', '/api/intelligence/recommendations', models.RecommendationListResponse, params=params)
 
     def perform_recommendation_action(self, recommendation_id: int, action: Optional[str] = None, feedback: Optional[str] = None) -> models.Recommendation:
         """
@@ -160,25 +824,27 @@ class TrendsAGIClient:
             raise ValueError("Either 'action' or 'feedback' must be provided.")
 
         payload = {"action": action, "feedback": feedback}
-        payload = {k: v for k, v in payload.items() if v is not None}
-        response_data = self._request('POST', f'/api/intelligence/recommendations/{recommendation_id}/action', json=payload)
-        return models.Recommendation.model_validate(response_data)
+        content = _encode_request(_validators.RECOMMENDATION_ACTION_REQUEST, payload, exclude_none=True)
+        return self._request_model('POST', f'/api/intelligence/recommendations/{recommendation_id}/action', models.Recommendation, content=content)
 
     def get_tracked_x_users(self, q: Optional[str] = None, min_followers: Optional[int] = None, sort_by: str = 'name_asc') -> models.MarketEntityListResponse:
         """
         Get a list of tracked X Users.
         """
-        params = {"q": q, "min_followers": min_followers, "sort_by": sort_by}
-        params = {k: v for k, v in params.items() if v is not None}
-        response_data = self._request('GET', '/api/intelligence/market/x-users', params=params)
-        return models.MarketEntityListResponse.model_validate(response_data)
+        params = _drop_none(q=q, min_followers=min_followers, sort_by=sort_by)
+        return self._request_model('GET', '/api/intelligence/market/x-users', models.MarketEntityListResponse, params=params)
 
     def get_tracked_x_user(self, entity_id: int) -> models.MarketEntity:
         """
         Retrieve a single tracked X User by their unique entity ID.
         """
-        response_data = self._request('GET', f'/api/intelligence/market/x-users/{entity_id}')
-        return models.MarketEntity.model_validate(response_data)
+        return self._request_model('GET', f'/api/intelligence/market/x-users/{entity_id}', models.MarketEntity)
+
+    def get_tracked_x_user_many(self, entity_ids: Iterable[int], max_workers: int = 16) -> List[models.MarketEntity]:
+        """
+        Retrieve several tracked X Users concurrently, returned in the order of ``entity_ids``.
+        """
+        return self._fan_out(self.get_tracked_x_user, entity_ids, max_workers)
 
     def create_tracked_x_user(self, handle: str, name: Optional[str] = None, description: Optional[str] = None, notes: Optional[str] = None) -> models.MarketEntity:
         """
@@ -186,19 +852,17 @@ class TrendsAGIClient:
         """
         payload = {"handle": handle, "name": name, "description": description, "notes": notes}
         payload = {k: v for k, v in payload.items() if v is not None}
-        response_data = self._request('POST', '/api/intelligence/market/x-users', json=payload)
-        return models.MarketEntity.model_validate(response_data)
+        return self._request_model('POST', '/api/intelligence/market/x-users', models.MarketEntity, json=payload)
         
     def update_tracked_x_user(self, entity_id: int, updates: Dict[str, Any]) -> models.MarketEntity:
         """
         Update details of a tracked X User.
         """
-        response_data = self._request('PUT', f'/api/intelligence/market/x-users/{entity_id}', json=updates)
-        return models.MarketEntity.model_validate(response_data)
+        return self._request_model('PUT', f'/api/intelligence/market/x-users/{entity_id}', models.MarketEntity, json=updates)
 
     def delete_tracked_x_user(self, entity_id: int) -> None:
         """Stop tracking an X User."""
-        self._request('DELETE', f'/api/intelligence/market/x-users/{entity_id}')
+        self._request_status('DELETE', f'/api/intelligence/market/x-users/{entity_id}')
 
     def get_crisis_events(
         self,
@@ -209,41 +873,56 @@ class TrendsAGIClient:
         """
         Get crisis events detected for the user.
         """
-        params = {
-            "limit": limit, "offset": offset, "status": status, "keyword": keyword, 
-            "severity": severity, "timeRange": time_range, "startDate": start_date, "endDate": end_date
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-        response_data = self._request('GET', '/api/intelligence/crisis-events', params=params)
-        return models.CrisisEventListResponse.model_validate(response_data)
+        params = _drop_none(
+            limit=limit, offset=offset, status=status, keyword=keyword, 
+            severity=severity, timeRange=time_range, startDate=start_date, endDate=end_date
+        )
+        return self._request_model('GET', '/api/intelligence/crisis-events', models.CrisisEventListResponse, params=params)
 
     def get_crisis_event(self, event_id: int) -> models.CrisisEvent:
         """
         Retrieve a single crisis event by its unique ID.
         """
-        response_data = self._request('GET', f'/api/intelligence/crisis-events/{event_id}')
-        return models.CrisisEvent.model_validate(response_data)
+        return self._request_model('GET', f'/api/intelligence/crisis-events/{event_id}', models.CrisisEvent)
+
+    def get_crisis_event_many(self, event_ids: Iterable[int], max_workers: int = 16) -> List[models.CrisisEvent]:
+        """
+        Retrieve several crisis events concurrently, returned in the order of ``event_ids``.
+        """
+        return self._fan_out(self.get_crisis_event, event_ids, max_workers)
 
     def perform_crisis_event_action(self, event_id: int, action: str) -> models.CrisisEvent:
         """
         Update the status of a crisis event (e.g., "acknowledge", "archive").
         """
-        response_data = self._request('POST', f'/api/intelligence/crisis-events/{event_id}/action', json={"action": action})
-        return models.CrisisEvent.model_validate(response_data)
+        return self._request_model('POST', f'/api/intelligence/crisis-events/{event_id}/action', models.CrisisEvent, json={"action": action})
 
     def perform_deep_analysis(self, query: str, force_refresh: bool = False) -> models.DeepAnalysis:
         """
         Perform deep AI analysis on a topic.
         """
-        response_data = self._request('POST', '/api/intelligence/deep-analysis', json={"query": query, "force_refresh": force_refresh})
-        return models.DeepAnalysis.model_validate(response_data)
+        return self._request_model('POST', '/api/intelligence/deep-analysis', models.DeepAnalysis, json={"query": query, "force_refresh": force_refresh})
+
+    def perform_deep_analysis_stream(self, query: str, force_refresh: bool = False) -> Iterator[models.DeepAnalysisChunk]:
+        """
+        Perform deep AI analysis on a topic, yielding partial updates as the server produces them.
+
+        Requests the analysis as server-sent events (``Accept: text/event-stream``) so progress
+        can be rendered before the full result is ready; the last chunk carries the complete
+        ``analysis``. If the server does not stream, its regular JSON reply is yielded as a
+        single ``complete`` chunk.
+        """
+        return self._stream_events(
+            'POST', '/api/intelligence/deep-analysis', models.DeepAnalysisChunk,
+            fallback=lambda body: _complete_analysis_chunk(body, self.trust_server),
+            json={"query": query, "force_refresh": force_refresh}
+        )
         
     # --- User & Account Management Methods (Non-sensitive) ---
 
     def get_topic_interests(self) -> List[models.TopicInterest]:
         """Retrieve the list of topic interests tracked by the user."""
-        response_data = self._request('GET', '/api/user/topic-interests')
-        return [models.TopicInterest.model_validate(item) for item in response_data]
+        return self._request_adapter('GET', '/api/user/topic-interests', List[models.TopicInterest], _validators.TOPIC_INTEREST_LIST)
 
     def create_topic_interest(
         self,
@@ -258,17 +937,15 @@ class TrendsAGIClient:
             "volume_threshold_value": volume_threshold_value, "percentage_growth_value": percentage_growth_value
         }
         payload = {k: v for k, v in payload.items() if v is not None}
-        response_data = self._request('POST', '/api/user/topic-interests', json=payload)
-        return models.TopicInterest.model_validate(response_data)
+        return self._request_model('POST', '/api/user/topic-interests', models.TopicInterest, json=payload)
         
     def delete_topic_interest(self, interest_id: int) -> None:
         """Delete a specific topic interest."""
-        self._request('DELETE', f'/api/user/topic-interests/{interest_id}')
+        self._request_status('DELETE', f'/api/user/topic-interests/{interest_id}')
 
     def get_export_settings(self) -> List[models.ExportConfiguration]:
         """Get all of the user's data export configurations."""
-        response_data = self._request('GET', '/api/user/export/settings')
-        return [models.ExportConfiguration.model_validate(item) for item in response_data]
+        return self._request_adapter('GET', '/api/user/export/settings', List[models.ExportConfiguration], _validators.EXPORT_CONFIG_LIST)
 
     def save_export_settings(
         self,
@@ -277,61 +954,76 @@ class TrendsAGIClient:
     ) -> models.ExportConfiguration:
         """
         Create or update an export configuration.
+
+        The configuration is validated locally first; invalid values raise ``ValueError``.
         """
         payload = {
             "id": config_id, "destination": destination, "config": config,
             "schedule": schedule, "schedule_time": schedule_time, "is_active": is_active,
         }
-        payload = {k: v for k, v in payload.items() if v is not None}
-        response_data = self._request('POST', '/api/user/export/settings', json=payload)
-        return models.ExportConfiguration.model_validate(response_data)
+        content = _encode_request(_validators.EXPORT_CONFIG_REQUEST, payload, exclude_none=True)
+        return self._request_model('POST', '/api/user/export/settings', models.ExportConfiguration, content=content)
 
     def delete_export_setting(self, config_id: int) -> None:
         """Delete an export configuration."""
-        self._request('DELETE', f'/api/user/export/settings/{config_id}')
+        self._request_status('DELETE', f'/api/user/export/settings/{config_id}')
 
     def get_export_history(self, limit: int = 15, offset: int = 0) -> models.ExportHistoryResponse:
         """Get the user's export execution history."""
-        response_data = self._request('GET', '/api/user/export/history', params={"limit": limit, "offset": offset})
-        return models.ExportHistoryResponse.model_validate(response_data)
+        return self._request_model('GET', '/api/user/export/history', models.ExportHistoryResponse, params={"limit": limit, "offset": offset})
 
     def run_export_now(self, config_id: int) -> models.ExportExecutionLog:
         """Trigger an immediate export."""
-        response_data = self._request('POST', f'/api/user/export/configurations/{config_id}/run-now')
-        return models.ExportExecutionLog.model_validate(response_data)
+        return self._request_model('POST', f'/api/user/export/configurations/{config_id}/run-now', models.ExportExecutionLog)
         
     def get_dashboard_stats(self) -> models.DashboardStats:
         """Get key statistics for the user's dashboard."""
-        response_data = self._request('GET', '/api/user/dashboard/stats')
-        return models.DashboardStats.model_validate(response_data)
+        return self._request_model('GET', '/api/user/dashboard/stats', models.DashboardStats, _validators.DASHBOARD_STATS)
 
     def get_recent_notifications(self, limit: int = 10) -> models.NotificationListResponse:
         """Get recent notifications for the user."""
-        response_data = self._request('GET', '/api/user/notifications/recent', params={"limit": limit})
-        return models.NotificationListResponse.model_validate(response_data)
+        return self._request_model(
+            'GET', '/api/user/notifications/recent', models.NotificationListResponse,
+            _validators.NOTIFICATION_LIST, params={"limit": limit}
+        )
+
+    def mark_notifications_read(self, ids: Optional[List[int]] = None, parse: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Mark notifications as read. If ids is None, marks all as read.
 
-    def mark_notifications_read(self, ids: Optional[List[int]] = None) -> Dict[str, Any]:
-        """Mark notifications as read. If ids is None, marks all as read."""
+        Pass ``parse=False`` to skip decoding the acknowledgement body and return None.
+        """
         payload = {"ids": ids if ids is not None else []}
-        return self._request('POST', '/api/user/notifications/mark-read', json=payload)
+        if not parse:
+            self._request_status('POST', '/api/user/notifications/mark-read', json=payload)
+            return None
+        return self._request_json('POST', '/api/user/notifications/mark-read', json=payload)
 
     # --- Public Information & Status Methods ---
     
-    def get_available_plans(self) -> List[models.SubscriptionPlan]:
-        """Retrieve a list of all publicly available subscription plans."""
-        response_data = self._request('GET', '/api/plans')
-        return [models.SubscriptionPlan.model_validate(plan) for plan in response_data]
+    @_ttl_cached(seconds=3600)
+    def get_available_plans(self, use_cache: bool = True) -> List[models.SubscriptionPlan]:
+        """
+        Retrieve a list of all publicly available subscription plans.
+
+        Results are cached; pass ``use_cache=False`` to force a fresh request.
+        """
+        return self._request_adapter('GET', '/api/plans', List[models.SubscriptionPlan], _validators.PLAN_LIST)
 
-    def get_api_status(self) -> models.StatusPage:
+    @_ttl_cached(seconds=60)
+    def get_api_status(self, use_cache: bool = True) -> models.StatusPage:
         """
         Retrieve the current operational status of the API and its components.
+
+        Results are cached briefly; pass ``use_cache=False`` to force a fresh request.
         """
-        response_data = self._request('GET', '/api/status')
-        return models.StatusPage.model_validate(response_data)
+        return self._request_model('GET', '/api/status', models.StatusPage)
         
-    def get_api_status_history(self) -> models.StatusHistoryResponse:
+    @_ttl_cached(seconds=300)
+    def get_api_status_history(self, use_cache: bool = True) -> models.StatusHistoryResponse:
         """
         Retrieve the 90-day uptime history for all API components.
+
+        Results are cached briefly; pass ``use_cache=False`` to force a fresh request.
         """
-        response_data = self._request('GET', '/api/status-history')
-        return models.StatusHistoryResponse.model_validate(response_data)
\ No newline at end of file
+        return self._request_model('GET', '/api/status-history', models.StatusHistoryResponse)
\ No newline at end of file
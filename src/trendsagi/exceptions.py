@@ -4,16 +4,24 @@ class TrendsAGIError(Exception):
     """Base exception for the TrendsAGI client library."""
     pass
 
-class AuthenticationError(TrendsAGIError):
-    """Raised when authentication fails (e.g., invalid API key)."""
-    pass
-
 class APIError(TrendsAGIError):
     """Raised for non-2xx API responses."""
     def __init__(self, status_code, error_detail):
         self.status_code = status_code
         self.error_detail = error_detail
-        super().__init__(f"API request failed with status {status_code}: {error_detail}")
+        if status_code is None:
+            # Raised client-side, before any request was made (e.g. missing API key).
+            super().__init__(*([] if error_detail is None else [error_detail]))
+        else:
+            super().__init__(f"API request failed with status {status_code}: {error_detail}")
+
+class AuthenticationError(APIError):
+    """Raised when authentication fails (e.g., invalid API key)."""
+    def __init__(self, status_code=None, error_detail=None):
+        if error_detail is None and not isinstance(status_code, int):
+            # Older code raises AuthenticationError("message") with no status code.
+            status_code, error_detail = None, status_code
+        super().__init__(status_code, error_detail)
 
 class NotFoundError(APIError):
     """Raised for 404 Not Found errors."""
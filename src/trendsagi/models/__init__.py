@@ -0,0 +1,99 @@
+# File: trendsagi/models/__init__.py
+"""
+Pydantic models for every TrendsAGI API response.
+
+The models are split into submodules by API area and are imported lazily on first
+attribute access (PEP 562), so building validators for e.g. the deep-analysis or
+custom-report models is only paid for by programs that actually use them.
+``trendsagi.models.TrendItem`` and ``from trendsagi.models import TrendItem`` work
+exactly as before.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+# Maps each public model name to the submodule that defines it.
+_MODEL_MODULES = {
+    "OrmBaseModel": "common",
+    "PaginationMeta": "common",
+    "TrendItem": "trends",
+    "TrendListResponse": "trends",
+    "TweetUser": "trends",
+    "Tweet": "trends",
+    "TrendDetail": "trends",
+    "TrendDataPoint": "trends",
+    "TrendAnalytics": "trends",
+    "TrendSearchResultItem": "insights",
+    "InsightSearchResponse": "insights",
+    "AIInsightContentBrief": "insights",
+    "AIInsightAdTargeting": "insights",
+    "AIInsight": "insights",
+    "CustomReportRequest": "reports",
+    "ReportMeta": "reports",
+    "CustomReport": "reports",
+    "RecommendationActionRequest": "intelligence",
+    "Recommendation": "intelligence",
+    "RecommendationListResponse": "intelligence",
+    "MarketEntity": "intelligence",
+    "MarketEntityListResponse": "intelligence",
+    "CrisisEvent": "intelligence",
+    "CrisisEventListResponse": "intelligence",
+    "DeepAnalysisSentiment": "analysis",
+    "DeepAnalysisActionableInsights": "analysis",
+    "DeepAnalysisRelatedTrend": "analysis",
+    "DeepAnalysis": "analysis",
+    "DeepAnalysisChunk": "analysis",
+    "TopicInterest": "user",
+    "ExportConfiguration": "user",
+    "ExportConfigurationRequest": "user",
+    "ExportExecutionLog": "user",
+    "ExportHistoryResponse": "user",
+    "DashboardStats": "user",
+    "Notification": "user",
+    "NotificationListResponse": "user",
+    "SubscriptionPlan": "status",
+    "ComponentStatus": "status",
+    "StatusPage": "status",
+    "StatusHistoryResponse": "status",
+}
+
+__all__ = list(_MODEL_MODULES)
+
+# Type checkers do not evaluate __getattr__; give them the real classes.
+if TYPE_CHECKING:  # pragma: no cover
+    from .common import OrmBaseModel, PaginationMeta
+    from .trends import (
+        TrendItem, TrendListResponse, TweetUser, Tweet, TrendDetail, TrendDataPoint,
+        TrendAnalytics,
+    )
+    from .insights import (
+        TrendSearchResultItem, InsightSearchResponse, AIInsightContentBrief,
+        AIInsightAdTargeting, AIInsight,
+    )
+    from .reports import CustomReportRequest, ReportMeta, CustomReport
+    from .intelligence import (
+        RecommendationActionRequest, Recommendation, RecommendationListResponse, MarketEntity,
+        MarketEntityListResponse, CrisisEvent, CrisisEventListResponse,
+    )
+    from .analysis import (
+        DeepAnalysisSentiment, DeepAnalysisActionableInsights, DeepAnalysisRelatedTrend,
+        DeepAnalysis, DeepAnalysisChunk,
+    )
+    from .user import (
+        TopicInterest, ExportConfiguration, ExportConfigurationRequest, ExportExecutionLog,
+        ExportHistoryResponse, DashboardStats, Notification, NotificationListResponse,
+    )
+    from .status import SubscriptionPlan, ComponentStatus, StatusPage, StatusHistoryResponse
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _MODEL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
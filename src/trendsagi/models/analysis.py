@@ -0,0 +1,44 @@
+# File: trendsagi/models/analysis.py
+
+from typing import List, Optional, Any
+from datetime import datetime
+
+from .common import OrmBaseModel
+
+# --- Deep Analysis Models ---
+class DeepAnalysisSentiment(OrmBaseModel):
+    overall_sentiment_category: str
+    positive_nuances: List[str]
+    negative_nuances: List[str]
+    neutral_aspects: List[str]
+
+class DeepAnalysisActionableInsights(OrmBaseModel):
+    marketing_pr: List[str]
+    product_development: List[str]
+    crm_strategy: List[str]
+    
+class DeepAnalysisRelatedTrend(OrmBaseModel):
+    id: str
+    name: str
+
+class DeepAnalysis(OrmBaseModel):
+    query_analyzed: str
+    generated_at: datetime
+    llm_model_used: str
+    overall_summary: str
+    key_findings: List[str]
+    sentiment_analysis: DeepAnalysisSentiment
+    causal_factors: List[str]
+    emerging_sub_topics: List[str]
+    future_outlook_and_predictions: List[str]
+    actionable_insights_for_roles: DeepAnalysisActionableInsights
+    related_trends: List[DeepAnalysisRelatedTrend]
+
+# One server-sent event from the streaming deep-analysis endpoint. ``event`` names the
+# update (e.g. "progress", "partial", "complete"); the final event carries ``analysis``.
+class DeepAnalysisChunk(OrmBaseModel):
+    event: str
+    section: Optional[str] = None
+    content: Optional[Any] = None
+    progress: Optional[float] = None
+    analysis: Optional[DeepAnalysis] = None
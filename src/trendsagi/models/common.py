@@ -0,0 +1,19 @@
+# File: trendsagi/models/common.py
+
+from pydantic import BaseModel
+from typing import Optional
+
+# --- Base & Helper Models ---
+class OrmBaseModel(BaseModel):
+    class Config:
+        from_attributes = True
+
+class PaginationMeta(OrmBaseModel):
+    total: int
+    limit: int
+    offset: int
+    period: Optional[str] = None
+    sort_by: Optional[str] = None
+    order: Optional[str] = None
+    search: Optional[str] = None
+    category: Optional[str] = None
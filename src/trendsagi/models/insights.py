@@ -0,0 +1,43 @@
+# File: trendsagi/models/insights.py
+
+from typing import List, Optional
+from datetime import datetime
+
+from .common import OrmBaseModel, PaginationMeta
+
+# --- Insights Models ---
+class TrendSearchResultItem(OrmBaseModel):
+    id: int
+    name: str
+    category: Optional[str] = None
+    volume: Optional[int] = None
+    timestamp: Optional[datetime] = None
+    meta_description: Optional[str] = None
+
+class InsightSearchResponse(OrmBaseModel):
+    trends: List[TrendSearchResultItem]
+    meta: PaginationMeta
+
+class AIInsightContentBrief(OrmBaseModel):
+    target_audience_segments: List[str]
+    key_angles_for_content: List[str]
+    suggested_content_formats: List[str]
+    call_to_action_ideas: List[str]
+
+class AIInsightAdTargeting(OrmBaseModel):
+    primary_audience_keywords: List[str]
+    secondary_audience_keywords: List[str]
+    potential_demographics_summary: Optional[str]
+
+class AIInsight(OrmBaseModel):
+    trend_id: int
+    trend_name: str
+    sentiment_summary: Optional[str]
+    sentiment_category: Optional[str]
+    key_themes: List[str]
+    content_brief: Optional[AIInsightContentBrief]
+    ad_platform_targeting: Optional[AIInsightAdTargeting]
+    potential_risks_or_controversies: List[str]
+    overall_topic_category_llm: Optional[str]
+    generated_at: datetime
+    llm_model_used: str
@@ -0,0 +1,74 @@
+# File: trendsagi/models/intelligence.py
+
+from pydantic import Field, HttpUrl
+from typing import List, Optional
+from datetime import datetime
+
+from .common import OrmBaseModel, PaginationMeta
+
+# --- Intelligence Suite Models ---
+# Request body for POST /api/intelligence/recommendations/{id}/action.
+class RecommendationActionRequest(OrmBaseModel):
+    action: Optional[str] = None
+    feedback: Optional[str] = None
+
+class Recommendation(OrmBaseModel):
+    id: int
+    user_id: int
+    type: str
+    title: str
+    details: str
+    source_trend_id: Optional[str] = None
+    source_trend_name: Optional[str] = None
+    priority: str
+    status: str
+    created_at: datetime
+    updated_at: datetime
+    user_feedback: Optional[str] = None
+
+class RecommendationListResponse(OrmBaseModel):
+    recommendations: List[Recommendation]
+    meta: PaginationMeta
+
+class MarketEntity(OrmBaseModel):
+    id: int
+    user_id: int
+    name: Optional[str] = None
+    handle: str
+    website: Optional[HttpUrl] = None
+    description: Optional[str] = None
+    notes: Optional[str] = None
+    followers_count: Optional[int] = None
+    overall_sentiment: Optional[str] = None
+    top_keywords: Optional[List[str]] = Field(default_factory=list, alias="top_keywords_json")
+    recent_topics: Optional[List[str]] = Field(default_factory=list, alias="recent_topics_json")
+    last_analyzed_at: Optional[datetime] = Field(None, alias="last_analyzed")
+    created_at: datetime
+    updated_at: datetime
+    
+    class Config:
+        populate_by_name = True
+
+class MarketEntityListResponse(OrmBaseModel):
+    items: List[MarketEntity]
+
+class CrisisEvent(OrmBaseModel):
+    id: int
+    user_id: int
+    title: str
+    summary: str
+    severity: str
+    status: str
+    detected_at: datetime
+    source_keywords: Optional[List[str]] = Field(None, alias="source_keywords_json")
+    impacted_entity: Optional[str] = None
+    trend_snapshot_link: Optional[HttpUrl] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        populate_by_name = True
+
+class CrisisEventListResponse(OrmBaseModel):
+    events: List[CrisisEvent]
+    meta: PaginationMeta
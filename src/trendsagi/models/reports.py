@@ -0,0 +1,32 @@
+# File: trendsagi/models/reports.py
+
+from typing import List, Optional, Any, Dict
+
+from .common import OrmBaseModel
+
+# --- Custom Report Models ---
+# Request body for POST /api/reports/custom. The server-side schema is not published,
+# so every field is optional and loosely typed, and unknown keys are passed through untouched.
+class CustomReportRequest(OrmBaseModel):
+    dimensions: Optional[List[Any]] = None
+    metrics: Optional[List[Any]] = None
+    filters: Optional[Any] = None
+    time_period: Optional[Any] = None
+    start_date: Optional[Any] = None
+    end_date: Optional[Any] = None
+    limit: Optional[Any] = None
+
+    class Config:
+        extra = "allow"
+
+class ReportMeta(OrmBaseModel):
+    row_count: int
+    limit_applied: Optional[int] = None
+    time_period: str
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+
+class CustomReport(OrmBaseModel):
+    columns: List[str]
+    rows: List[Dict[str, Any]]
+    meta: ReportMeta
@@ -0,0 +1,32 @@
+# File: trendsagi/models/status.py
+
+from pydantic import Field
+from typing import List, Optional, Any, Dict
+from datetime import datetime
+
+from .common import OrmBaseModel
+
+# --- Public Information & Status Models ---
+class SubscriptionPlan(OrmBaseModel):
+    id: int
+    name: str
+    description: Optional[str] = None
+    price_monthly: Optional[float] = None
+    price_yearly: Optional[float] = None
+    is_custom: bool
+    features: Optional[Dict[str, Any]] = Field(default_factory=dict)
+
+class ComponentStatus(OrmBaseModel):
+    name: str
+    status: str
+    description: str
+
+class StatusPage(OrmBaseModel):
+    overall_status: str
+    last_updated: datetime
+    components: List[ComponentStatus]
+
+# NEW: Model for API Status History
+class StatusHistoryResponse(OrmBaseModel):
+    uptime_percentages: Dict[str, float]
+    daily_statuses: Dict[str, Dict[str, str]]
@@ -0,0 +1,52 @@
+# File: trendsagi/models/trends.py
+
+from pydantic import Field
+from typing import List, Optional
+from datetime import datetime
+
+from .common import OrmBaseModel, PaginationMeta
+
+# --- Trends Models ---
+class TrendItem(OrmBaseModel):
+    id: int
+    name: str
+    volume: Optional[int] = None
+    timestamp: datetime
+    meta_description: Optional[str] = None
+    category: Optional[str] = None
+    growth: Optional[float] = None
+    previous_volume: Optional[int] = None
+    absolute_change: Optional[int] = None
+
+class TrendListResponse(OrmBaseModel):
+    trends: List[TrendItem]
+    meta: PaginationMeta
+    
+class TweetUser(OrmBaseModel):
+    id: int
+    user_id: int
+    screen_name: str
+    name: Optional[str] = None
+
+class Tweet(OrmBaseModel):
+    id: int
+    tweet_id: int
+    text: str
+    created_at: datetime
+    user: Optional[TweetUser] = None
+
+class TrendDetail(TrendItem):
+    tweets: List[Tweet] = Field(default_factory=list)
+
+class TrendDataPoint(OrmBaseModel):
+    date: datetime
+    volume: Optional[int] = None
+    growth_rate: Optional[float] = None
+
+class TrendAnalytics(OrmBaseModel):
+    trend_id: int
+    name: str
+    period: str
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    data: List[TrendDataPoint]
@@ -0,0 +1,67 @@
+# File: trendsagi/models/user.py
+
+from typing import List, Optional, Any, Dict
+from datetime import datetime
+
+from .common import OrmBaseModel, PaginationMeta
+
+# --- User & Account Management Models ---
+class TopicInterest(OrmBaseModel):
+    id: int
+    user_id: int
+    keyword: str
+    alert_condition_type: str
+    volume_threshold_value: Optional[int] = None
+    percentage_growth_value: Optional[float] = None
+    created_at: datetime
+
+class ExportConfiguration(OrmBaseModel):
+    id: int
+    destination: str
+    config: Dict[str, Any]
+    schedule: str
+    schedule_time: Optional[str] = None
+    is_active: bool
+
+# Request body for POST /api/user/export/settings; ``id`` updates an existing configuration.
+class ExportConfigurationRequest(OrmBaseModel):
+    id: Optional[int] = None
+    destination: str
+    config: Dict[str, Any]
+    schedule: str = "none"
+    schedule_time: Optional[str] = None
+    is_active: bool = False
+
+class ExportExecutionLog(OrmBaseModel):
+    id: int
+    execution_time: datetime
+    duration_seconds: Optional[float] = None
+    destination: str
+    status: str
+    message: Optional[str] = None
+    records_exported: Optional[int] = None
+    export_configuration_id: Optional[int] = None
+
+class ExportHistoryResponse(OrmBaseModel):
+    history: List[ExportExecutionLog]
+    meta: PaginationMeta
+
+class DashboardStats(OrmBaseModel):
+    active_trends: int
+    alerts_today: int
+    topic_interests: int
+    avg_growth: Optional[float] = None
+
+class Notification(OrmBaseModel):
+    id: int
+    title: str
+    message: str
+    notification_type: str
+    is_read: bool
+    created_at: datetime
+    read_at: Optional[datetime] = None
+    data: Optional[Dict[str, Any]] = None
+
+class NotificationListResponse(OrmBaseModel):
+    notifications: List[Notification]
+    unread_count: int